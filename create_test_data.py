@@ -1,6 +1,5 @@
 #!/usr/bin/env python
-import pickle
-from deepThought.ORM.ORM import Job, Task, Resource, Capability, RequiredResource, DistributionType
+from deepThought.ORM.ORM import Job, Task, Resource, Capability, RequiredResource, DistributionType, serialize
 import random
 import math
 
@@ -15,6 +14,7 @@ for i in range(5):
     cap.name = f"Capability {i}"
     capabilities[cap.id] = cap
     job.capabilities[cap.id] = cap
+cap_ids = list(capabilities.keys())
 
 # Create some resources
 resources = {}
@@ -27,12 +27,15 @@ for i in range(10):
     # Each resource provides 1-3 capabilities
     num_caps = random.randint(1, 3)
     for j in range(num_caps):
-        cap_id = random.choice(list(capabilities.keys()))
+        cap_id = random.choice(cap_ids)
         res.provided_capabilities.append(job.capabilities[cap_id])
     
     resources[res.id] = res
     job.resources[res.id] = res
 
+# Capability ids offered by each resource, for constant-time requirement checks
+provided = {res.id: frozenset(cap.id for cap in res.provided_capabilities) for res in job.resources.values()}
+
 # Create some tasks with dependencies
 num_tasks = 20
 tasks = {}
@@ -53,18 +56,13 @@ for i in range(num_tasks):
         
         # Add 1-2 required capabilities
         num_req_caps = random.randint(1, 2)
-        for k in range(num_req_caps):
-            cap_id = random.choice(list(capabilities.keys()))
+        for cap_id in random.sample(cap_ids, num_req_caps):
             req_res.required_capabilities.append(job.capabilities[cap_id])
+        req_ids = frozenset(cap.id for cap in req_res.required_capabilities)
         
         # Find resources that can fulfill this requirement
         for res in job.resources.values():
-            can_fulfill = True
-            for cap in req_res.required_capabilities:
-                if cap not in res.provided_capabilities:
-                    can_fulfill = False
-                    break
-            if can_fulfill:
+            if req_ids.issubset(provided[res.id]):
                 req_res.fulfilled_by.append(res)
                 res.required_by.append(task)
         
@@ -78,7 +76,6 @@ for i in range(num_tasks):
 job.already_initialized = True
 
 # Save the job to a pickle file
-with open("sampleData/test_data.pickle", "wb") as f:
-    pickle.dump(job, f)
+serialize(job, "sampleData/test_data.pickle")
 
 print(f"Created test dataset with {num_tasks} tasks and {len(job.resources)} resources") 
\ No newline at end of file
@@ -12,9 +12,14 @@ class DistributionType(Enum):
     PHASE = 3
     PRECOMPUTED = 4
 
+def _load_pickle(file_path):
+    with open(file_path, "rb") as f:
+        return pickle.loads(f.read())  # unpickle from one contiguous buffer instead of many small reads
+
+
 def deserialize(file_path):
     Logger.info("loading data from file: %s" % file_path)
-    job = pickle.load(open(file_path, "rb"))
+    job = _load_pickle(file_path)
     Logger.info("loaded %s tasks" % (len(list(job.tasks.values()))))
     Logger.info("loaded %s resources" % (len(list(job.resources.values()))))
     Logger.info("loaded %s capabilities"  % (len(list(job.capabilities.values()))))
@@ -22,6 +27,12 @@ def deserialize(file_path):
     return job
 
 
+def serialize(job, file_path):
+    Logger.info("writing data to file: %s" % file_path)
+    with open(file_path, "wb") as f:
+        pickle.dump(job, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+
 class Job(object):
     def __init__(self):
         self.tasks = {}
@@ -69,14 +80,15 @@ class Task:
             self.distribution_type = DistributionType.FIXED # We don't have variance and mean. Just take the mean with a certain jitter.
 
     def get_next_execution_time(self):
-        if self.distribution_type == DistributionType.FITTED:
-             return self.inverse_cdf(np.random.uniform())
-        elif self.distribution_type == DistributionType.PHASE:
-            return self.inverse_cdf.rvs()
-        elif self.distribution_type == DistributionType.FIXED:
+        distribution_type = self.distribution_type
+        if distribution_type is DistributionType.FIXED: # most common case, checked first
             range = self.mean * 0.1 #ten percent jitter
             jitter = (2 * range) * np.random.random_sample() -range
             return self.mean + jitter
+        elif distribution_type is DistributionType.FITTED:
+             return self.inverse_cdf(np.random.uniform())
+        elif distribution_type is DistributionType.PHASE:
+            return self.inverse_cdf.rvs()
         else:
             assert  len(self.pre_computed_execution_times) > 0
             return self.pre_computed_execution_times.pop()
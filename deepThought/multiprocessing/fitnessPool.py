@@ -0,0 +1,48 @@
+__author__ = 'jules'
+"""
+Process pool for evaluating the fitness of GA individuals in parallel. The job is handed to every worker once when the
+worker starts, afterwards only the individuals are sent over.
+Jobs with precomputed execution times must not be evaluated here: every worker would pop the same samples from its
+copy of the lists.
+"""
+from concurrent.futures import ProcessPoolExecutor
+import numpy
+import random
+
+_job = None
+
+
+def create_pool(job, nr_cores):
+    return ProcessPoolExecutor(max_workers=nr_cores, initializer=_init_worker, initargs=(job,))
+
+
+def _init_worker(job):
+    global _job
+    _job = job
+    # forked workers inherit the parent's random state. reseed so they don't all draw the same execution times
+    numpy.random.seed()
+    random.seed()
+
+
+def evaluate(fitness_function, individual):
+    """Calls fitness_function(job, individual) with the job of the current worker."""
+    return fitness_function(_job, individual)
+
+
+def register_evaluation(toolbox, fitness_function, job, pool=None):
+    """
+    Registers evaluate, map and evaluate_all on a deap toolbox. fitness_function(job, individual) runs in the pool
+    workers if a pool is given, in this process otherwise. toolbox.evaluate_all(individuals) returns the fitnesses.
+    """
+    if pool is None:
+        toolbox.register("evaluate", fitness_function, job)
+        toolbox.register("map", map)
+    else:
+        toolbox.register("evaluate", evaluate, fitness_function)
+        toolbox.register("map", pool.map)
+    toolbox.register("evaluate_all", _evaluate_all, toolbox)
+
+
+def _evaluate_all(toolbox, individuals):
+    # send plain lists, the creator classes may not exist in pool workers
+    return toolbox.map(toolbox.evaluate, [list(ind) for ind in individuals])
@@ -9,9 +9,10 @@ from deepThought.scheduler.DomainRB import DomainRB
 This class is the implementation of our own Algorithm which is based on the work by Ashtiani et al.
 """
 class JFPol(Scheduler):
-    def __init__(self, job):
+    def __init__(self, job, pool = None):
         super(JFPol, self).__init__(job)
         self.job = job
+        self.pool = pool # optional process pool for the fitness evaluations of the GA
 
     def _reschedule(self):
         return self.scheduler._reschedule()
@@ -21,7 +22,7 @@ class JFPol(Scheduler):
         Logger.info("Generating initial Population with RBRS")
         initial_pop = self._generate_RBRS(self.job, 10)
         Logger.info("Applying ListGA to initial population")
-        listGA = ListGA(self.job, initial_pop)
+        listGA = ListGA(self.job, initial_pop, self.pool)
         task_list = listGA.do_it(150, 0.8, 0.2)[0]
         self.listGALog = listGA.get_logbook()
 
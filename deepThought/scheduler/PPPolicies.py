@@ -10,9 +10,10 @@ from deepThought.scheduler.MfssRb import MfssRB
 This class is the implementation of the Algorithm Proposed by Ashtiani et al.
 """
 class PPPolicies(Scheduler):
-    def __init__(self, job, parameters = None):
+    def __init__(self, job, parameters = None, pool = None):
         super(PPPolicies, self).__init__(job)
         self.job = job
+        self.pool = pool # optional process pool for the fitness evaluations of the GAs
         if parameters is not None:
             self.param = parameters
         else:
@@ -35,11 +36,11 @@ class PPPolicies(Scheduler):
         Logger.info("Generating initial Population with RBRS")
         initial_pop = self._generate_RBRS(self.job, self.param["listNoList"])
         Logger.info("Applying ListGA to initial population")
-        listGA = ListGA(self.job, initial_pop)
+        listGA = ListGA(self.job, initial_pop, self.pool)
         task_list = listGA.do_it(self.param["listGAGen"], self.param["listGACXp"], self.param["listGAMUTp"])[0]
         self.listGALog = listGA.get_logbook()
         if self.param["arcGAGen"] > 0:
-            arcGA = ArcGA(self.job, task_list)
+            arcGA = ArcGA(self.job, task_list, self.pool)
             arc_list = arcGA.do_it(self.param["arcGAGen"], self.param["arcGACXp"],self.param["arcGAMUTp"])[0] #2, 0.5, 0.1
             #Logger.warning("len arc list: %s" % (len(arc_list)))
             self.arcGALog = arcGA.get_logbook()
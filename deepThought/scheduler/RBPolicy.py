@@ -11,7 +11,7 @@ class RBPolicy(Scheduler):
     def __init__(self, job, order_list = None):
         super(RBPolicy, self).__init__(job)
         if order_list is not None:
-            self.order_list = copy.deepcopy(order_list) #maybe this can be done better
+            self.order_list = list(order_list) # task ids are immutable, a shallow copy is enough
         else:
             self.order_list = copy.copy([job.id in list(self.job.to_run.values())])
 
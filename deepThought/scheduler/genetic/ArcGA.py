@@ -7,6 +7,8 @@ from deap import tools, base, creator, algorithms
 from deepThought.scheduler.RBPolicy import RBPolicy
 from deepThought.scheduler.MfssRb import MfssRB
 from deepThought.util import Logger, UnfeasibleScheduleException
+import deepThought.multiprocessing.fitnessPool as fitnessPool
+import functools
 import random
 import copy
 import numpy as np
@@ -14,8 +16,7 @@ import numpy as np
 
 class ArcGA():
 
-    def __init__(self, job, base_schedule):
-        import deepThought.simulator.simulator as sim
+    def __init__(self, job, base_schedule, pool=None):
         self.job = job # this is required for the simulator which is needed to compute the fitness of an individual
         self.base_schedule = base_schedule[:]
         self.toolbox = base.Toolbox()
@@ -54,27 +55,16 @@ class ArcGA():
                         break
             return creator.ArcList(individual)
 
-        #The actual fitness function
-        def evalSchedule(individual):
-            rb_policy_schedule = RBPolicy(self.job, self.base_schedule)
-            reference = sim.simulate_schedule(rb_policy_schedule, stochastic=True )
-
-            scheduler = MfssRB(self.job, self.base_schedule, individual)
-            try:
-                time = sim.simulate_schedule(scheduler, old_execution_history=reference ).total_time
-            except UnfeasibleScheduleException:
-                return None
-            return (reference.total_time - time, scheduler.no_resource_conflicts)
-
         #self.toolbox.register("population", tools.initRepeat, list, create_inital_arc_list)
         self.toolbox.register("population", tools.initRepeat, list, create_initial_pop)
-        self.toolbox.register("evaluate", evalSchedule)
+        fitness_function = functools.partial(evalSchedule, base_schedule=list(self.base_schedule))
+        fitnessPool.register_evaluation(self.toolbox, fitness_function, self.job, pool)
         self.toolbox.register("select", tools.selBest)
-        self.toolbox.register("map",  map)
 
-        self.stats = tools.Statistics(key=lambda ind: ind.fitness.values[0] if ind.fitness.valid else -100000)
-        self.stats.register("min", np.min)
-        self.stats.register("max", np.max)
+        # invalid individuals are logged as nan so they drop out of the statistics and show up as gaps in plots
+        self.stats = tools.Statistics(key=lambda ind: ind.fitness.values[0] if ind.fitness.valid else np.nan)
+        self.stats.register("min", np.nanmin)
+        self.stats.register("max", np.nanmax)
 
         self.logbook = tools.Logbook()
 
@@ -83,7 +73,7 @@ class ArcGA():
         pop = self.toolbox.population(n=self.no_p)
         Logger.info("ArcGA: Calculating base fitness")
         #inital calculation of fitness for base population.
-        fitness = self.toolbox.map(self.toolbox.evaluate, pop)
+        fitness = self.toolbox.evaluate_all(pop)
         for ind, fit in zip(pop, fitness):
             if fit is not None:
                 ind.fitness.values = fit
@@ -106,12 +96,11 @@ class ArcGA():
                     self.mutate(mutant, 0.5)
 
 
-            #invalids = [ind for ind in pop if not ind.fitness.valid]
             for ind in best:
                 if not ind in pop:
                     pop.append(ind)
 
-            fitnesses = self.toolbox.map(self.toolbox.evaluate, pop)
+            fitnesses = self.toolbox.evaluate_all(pop)
             for ind, fit in zip(pop, fitnesses):
                 if fit is not None:
                     ind.fitness.values = fit
@@ -145,7 +134,7 @@ class ArcGA():
 
 
     def crossover(self, population, cxpb):
-        to_cross = copy.deepcopy(population)
+        to_cross = list(population) # only read from, the offsprings are built from the immutable arcs
         offsprings = []
         while len(to_cross) > 1:
             father = random.choice(to_cross)
@@ -191,3 +180,15 @@ class ArcGA():
     def get_logbook(self):
         return self.logbook
 
+#The actual fitness function
+def evalSchedule(job, individual, base_schedule):
+    import deepThought.simulator.simulator as sim
+    rb_policy_schedule = RBPolicy(job, base_schedule)
+    reference = sim.simulate_schedule(rb_policy_schedule, stochastic=True )
+
+    scheduler = MfssRB(job, base_schedule, individual)
+    try:
+        time = sim.simulate_schedule(scheduler, old_execution_history=reference ).total_time
+    except UnfeasibleScheduleException:
+        return None
+    return (reference.total_time - time, scheduler.no_resource_conflicts)
@@ -8,14 +8,14 @@ from deap import tools, base, creator
 from deepThought.scheduler.RBPolicy import RBPolicy
 from deepThought.scheduler.ABPolicy import ABPolicy
 from deepThought.util import UnfeasibleScheduleException, Logger
+import deepThought.multiprocessing.fitnessPool as fitnessPool
 import random
 import copy
 
 
 class ListGA():
 
-    def __init__(self, job, list_of_initial_pop):
-        import deepThought.simulator.simulator as sim
+    def __init__(self, job, list_of_initial_pop, pool=None):
         self.job = job # this is required for the simulator which is needed to compute the fitness of an individual
         self.task_count = len(job.tasks.keys())  # Get actual task count instead of hardcoded value
         self.no_list = len(list_of_initial_pop)
@@ -25,17 +25,6 @@ class ListGA():
         creator.create("FitnessMin", base.Fitness, weights=(-1.0,-1.0)) # we want to minimize the makespan
         creator.create("ActivityList", list, fitness=creator.FitnessMin)
 
-        #The actual fitness function
-        def evalSchedule(individual):
-            rb_pol = RBPolicy(self.job, individual)
-            #ab_pol = ABPolicy(self.job, individual)
-            try:
-                result = sim.simulate_schedule(rb_pol, stochastic=True )
-                return result.total_time, rb_pol.no_resource_conflicts
-            except (UnfeasibleScheduleException, RuntimeError):
-                return None
-
-
        #this method returns lists of tasks out the initial population list which are generated by the RBRS
         def create_initial_population():
             assert len(self.list_of_initial_pop) >= self.inital_pop_constructed
@@ -48,9 +37,8 @@ class ListGA():
 
 
         self.toolbox.register("population", tools.initRepeat, list, create_initial_population)
-        self.toolbox.register("evaluate", evalSchedule)
+        fitnessPool.register_evaluation(self.toolbox, evalSchedule, self.job, pool)
         self.toolbox.register("select", tools.selBest)
-        self.toolbox.register("map",  map)
         self.stats = tools.Statistics(key=lambda ind: ind.fitness.values[0])
         self.stats.register("avg", np.mean)
         self.stats.register("std", np.std)
@@ -63,7 +51,7 @@ class ListGA():
         pop = self.toolbox.population(n=self.no_list)
 
         #inital calculation of fitness for base population. TODO: Optimization. InitialFitness can be taken from the Job Object itself.
-        fitness = self.toolbox.map(self.toolbox.evaluate, pop)
+        fitness = self.toolbox.evaluate_all(pop)
         for ind, fit in zip(pop, fitness):
             ind.fitness.values = fit
 
@@ -89,8 +77,8 @@ class ListGA():
             for ind in best:
                 if not ind in pop:
                     pop.append(ind)
-            #invalids = [ind for ind in pop if not ind.fitness.valid]
-            fitnesses = self.toolbox.map(self.toolbox.evaluate, pop)
+            # the simulated makespan is stochastic, so the elites are resampled too instead of evaluating only invalids
+            fitnesses = self.toolbox.evaluate_all(pop)
             for ind, fit in zip(pop, fitnesses):
                 if fit is not None:
                     ind.fitness.values = fit
@@ -100,6 +88,17 @@ class ListGA():
     def get_logbook(self):
         return self.logbook
 
+#The actual fitness function
+def evalSchedule(job, individual):
+    import deepThought.simulator.simulator as sim
+    rb_pol = RBPolicy(job, individual)
+    #ab_pol = ABPolicy(job, individual)
+    try:
+        result = sim.simulate_schedule(rb_pol, stochastic=True )
+        return result.total_time, rb_pol.no_resource_conflicts
+    except (UnfeasibleScheduleException, RuntimeError):
+        return None
+
 def mutate(mutant, mutpb):
 
     for i in range(len(mutant) -2):
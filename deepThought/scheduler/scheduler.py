@@ -40,6 +40,13 @@ class Scheduler(object, metaclass=abc.ABCMeta):
         self.no_tasks_executed +=1
         return task
 
+    def drain_ready(self):
+        """Returns all tasks which can be started right now."""
+        ready = []
+        while self.has_next():
+            ready.append(self.get_next())
+        return ready
+
     def get_execution_history(self):
         return self.execution_history
 
@@ -0,0 +1,25 @@
+__author__ = 'jules'
+import heapq
+import itertools
+
+
+class Environment(object):
+    """
+    Minimal discrete event loop used by the schedule simulation. Pending events are kept in a heap of
+    (time, sequence number, callback) entries, so events due at the same time fire in the order they were scheduled.
+    """
+    def __init__(self):
+        self.now = 0
+        self._queue = []
+        self._eid = itertools.count()
+
+    def schedule(self, delay, callback):
+        if delay < 0:
+            raise ValueError("Negative delay %s" % delay)
+        heapq.heappush(self._queue, (self.now + delay, next(self._eid), callback))
+
+    def run(self):
+        queue = self._queue
+        while queue:
+            self.now, _, callback = heapq.heappop(queue)
+            callback()
@@ -5,15 +5,14 @@ class SimulationEntity(object):
     def __init__(self, env, task, callback, stochastic, old_execution_history):
         self.env = env
         self.task = task
-        self.action = env.process(self.run())
         self.callback_proc = callback
         self.stochastic = stochastic
         self.old_execution_history = old_execution_history
 
-    def run(self):
+        self.task.set_started(env.now)
+        env.schedule(self.compute_sleep_duration(), self.finish)
 
-        self.task.set_started(self.env.now)
-        yield self.env.timeout(self.compute_sleep_duration())
+    def finish(self):
         self.task.set_finished(self.env.now)
         self.task.set_completed()
         self.callback_proc(self.env)
@@ -1,6 +1,8 @@
 __author__ = 'jules'
 
 from deepThought.util import Logger
+from deepThought.ORM.ORM import _load_pickle
+import numpy as np
 import pickle
 
 
@@ -10,18 +12,70 @@ class SimulationResult(object):
         self.execution_history = []
         self.parallelity_factor = 1
         self.jobs = {}
+        self._arr = None
 
     def set_execution_history(self, execution_history):
         self.execution_history = execution_history
         for job in execution_history:
             self.jobs[job.id] = job
             job.scheduler = None
+        self._arr = None  # the column arrays no longer match the history, built again on demand
+
+    @property
+    def task_table(self):
+        """Structured array with the fields start, dur and name, one row per executed task"""
+        self.ensure_arrays()
+        return self._arr
+
+    @property
+    def resources(self):
+        """The distinct resources used by the tasks, in the order of their indices"""
+        self.ensure_arrays()
+        return self._resources
+
+    @property
+    def resource_indptr(self):
+        """resource_indices[resource_indptr[i]:resource_indptr[i + 1]] are the resources used by task i"""
+        self.ensure_arrays()
+        return self._res_indptr
+
+    @property
+    def resource_indices(self):
+        """Indices into resources, grouped by task, see resource_indptr"""
+        self.ensure_arrays()
+        return self._res_indices
+
+    def ensure_arrays(self):
+        """Builds the column arrays unless they are up to date, e.g. for results created in memory"""
+        if getattr(self, '_arr', None) is None:
+            self.build_arrays()
+
+    def build_arrays(self):
+        """
+        Builds the column arrays of the execution history for vectorized analysis, read them through task_table,
+        resources, resource_indptr and resource_indices.
+        """
+        history = self.execution_history
+        name_length = max([len(task.name) for task in history], default=1)
+        table = np.empty(len(history), dtype=[('start', 'f8'), ('dur', 'f8'), ('name', 'U%d' % name_length)])
+        self._res_indptr = np.zeros(len(history) + 1, np.int64)
+        index = {}
+        indices = []
+        for i, task in enumerate(history):
+            table[i] = (task.started, task.finished - task.started, task.name)
+            indices.extend(index.setdefault(resource, len(index)) for resource in task.usedResources)
+            self._res_indptr[i + 1] = len(indices)
+        self._res_indices = np.array(indices, np.int32)
+        self._resources = list(index)
+        self._arr = table  # set last, it marks the arrays as complete
+
 
 def save_simulation_result(result, output_file):
     Logger.info("writing simulation result to file: %s" % output_file)
-    pickle.dump(result, open(output_file, "wb"))
+    with open(output_file, "wb") as f:
+        pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
 
 
 def load_simulation_result(file_path):
     Logger.info("loading simulation result from file: %s " % file_path )
-    return pickle.load(open(file_path, "rb"))
+    return _load_pickle(file_path)
@@ -1,11 +1,9 @@
 __author__ = 'jules'
 
-import simpy
 import argparse
 import sys
 import copy
 import deepThought.ORM.ORM as ORM
-import pickle
 
 from deepThought.scheduler.referenceScheduler import ReferenceScheduler
 from deepThought.scheduler.optimizedDependencyScheduler import OptimizedDependencyScheduler
@@ -16,6 +14,8 @@ from deepThought.scheduler.JFPol import JFPol
 from deepThought.simulator.simulationResult import *
 
 from deepThought.simulator.simulationEntity import SimulationEntity
+from deepThought.multiprocessing.fitnessPool import create_pool
+from deepThought.simulator.environment import Environment
 import random
 import numpy as np
 import time
@@ -32,6 +32,7 @@ def main():
     arg_parser.add_argument("--output", help="specifies the file where the result should be written to")
     arg_parser.add_argument("--precomputeprobability", help="precomputes the probability data. follwed by a number")
     arg_parser.add_argument("--show_gen_log", help="controls whether to show historic genetic data")
+    arg_parser.add_argument("--cores", help="evaluates the fitness of the genetic schedulers on this many processes", type=int)
     args = arg_parser.parse_args()
 
     #comment out if deterministic solutions are required
@@ -57,14 +58,30 @@ def main():
         JFPol.__name__ : JFPol
     }
 
+    pool = None
     if args.scheduler is None:
+        if args.cores is not None:
+            Logger.warning("ReferenceScheduler does not use a genetic algorithm, ignoring --cores")
         scheduler = ReferenceScheduler(job)
     else:
         try:
-            scheduler =  schedulers[args.scheduler](job)
+            scheduler_class = schedulers[args.scheduler]
         except KeyError:
             Logger.error("The scheduler specified does not exist.")
             sys.exit(127)
+        # precomputed execution times are popped from per task lists. every worker would pop the same copies in
+        # lockstep and the parent's lists would stay untouched, so such jobs are always evaluated serially
+        uses_precomputed_times = args.precomputeprobability is not None or \
+            any(task.distribution_type is ORM.DistributionType.PRECOMPUTED for task in job.tasks.values())
+        if args.cores is not None and scheduler_class in (PPPolicies, JFPol) and not uses_precomputed_times:
+            pool = create_pool(job, args.cores)
+            scheduler = scheduler_class(job, pool=pool)
+        else:
+            if args.cores is not None and scheduler_class not in (PPPolicies, JFPol):
+                Logger.warning("%s does not use a genetic algorithm, ignoring --cores" % args.scheduler)
+            elif args.cores is not None and uses_precomputed_times:
+                Logger.warning("job uses precomputed execution times, ignoring --cores")
+            scheduler = scheduler_class(job)
 
     if args.precomputeprobability is not None:
         Logger.debug("initializing job")
@@ -78,35 +95,36 @@ def main():
         scheduler.initialize()
         job.already_initialized = True
         Logger.info("Writing to file")
-        pickle.dump(job, open(args.file, "wb"))
+        ORM.serialize(job, args.file)
         sys.exit(0)
 
     start_time = datetime.datetime.now()
-    if job.already_initialized == False:
-        job.initialize()
-        scheduler.initialize()
-        Logger.debug("initializing job")
-    else:
-        # Make sure the scheduler is initialized even if the job is already initialized
-        if hasattr(scheduler, 'initialize'):
+    try:
+        if job.already_initialized == False:
+            job.initialize()
             scheduler.initialize()
-
-
+            Logger.debug("initializing job")
+        else:
+            # Make sure the scheduler is initialized even if the job is already initialized
+            if hasattr(scheduler, 'initialize'):
+                scheduler.initialize()
+    finally:
+        if pool is not None:
+            pool.shutdown()
 
     Logger.debug("starting simulation...")
     result = simulate_schedule(scheduler)
     duration = datetime.datetime.now() - start_time
     Logger.warning("Simulation  complete. Duration: %s" % (duration))
+    log_list = scheduler.getListGALog() if hasattr(scheduler, 'getListGALog') else None
     if args.show_gen_log is not None:
-        log_list = scheduler.getListGALog()
-
         list_min = [datapoint['min'] for datapoint in log_list]
         list_max = [datapoint['max'] for datapoint in log_list]
 
         fig = plt.figure(figsize=(12, 10))
         ax = fig.add_subplot(2, 1, 1)
-        p1 = ax.plot(list(range(len(list_min))),list_min, 'b-', marker='o')
-        p2 = ax.plot(list(range(len(list_max))),list_max, 'r-', marker='x')
+        p1 = ax.plot(np.arange(len(list_min)),list_min, 'b-', marker='o')
+        p2 = ax.plot(np.arange(len(list_max)),list_max, 'r-', marker='x')
 
         ax.set_xlabel("ListGA Generation", fontsize=12)
         ax.set_ylabel("Fitness (execution time)", fontsize=12)
@@ -138,11 +156,8 @@ def main():
         list_min = [datapoint['min'] for datapoint in log_arc]
         list_max = [datapoint['max'] for datapoint in log_arc]
 
-        for entry in list_max:
-            if type(entry) == tuple:
-                list_max.remove(entry)
-        p1 = ax.plot(list(range(len(list_min))),list_min, 'b-', marker='o')
-        p2 = ax.plot(list(range(len(list_max))),list_max, 'r-', marker='x')
+        p1 = ax.plot(np.arange(len(list_min)),list_min, 'b-', marker='o')
+        p2 = ax.plot(np.arange(len(list_max)),list_max, 'r-', marker='x')
 
         ax.set_xlabel("ArcGA Generation", fontsize=12)
         ax.set_ylabel("Fitness", fontsize=12)
@@ -186,16 +201,14 @@ def main():
             print(f"\nTotal project duration: {result.total_time:.2f} time units")
             print(f"Total tasks executed: {len(result.execution_history)}")
             
-            if hasattr(scheduler, 'getListGALog') and scheduler.getListGALog():
-                log = scheduler.getListGALog()
-                if log and len(log) > 1:
-                    initial_fitness = log[0]['min']
-                    final_fitness = log[-1]['min']
-                    improvement = (initial_fitness - final_fitness) / initial_fitness * 100
-                    print(f"\nGenetic Algorithm Improvement:")
-                    print(f"  Initial best fitness: {initial_fitness:.2f}")
-                    print(f"  Final best fitness: {final_fitness:.2f}")
-                    print(f"  Improvement: {improvement:.2f}%")
+            if log_list and len(log_list) > 1:
+                initial_fitness = log_list[0]['min']
+                final_fitness = log_list[-1]['min']
+                improvement = (initial_fitness - final_fitness) / initial_fitness * 100
+                print(f"\nGenetic Algorithm Improvement:")
+                print(f"  Initial best fitness: {initial_fitness:.2f}")
+                print(f"  Final best fitness: {final_fitness:.2f}")
+                print(f"  Improvement: {improvement:.2f}%")
             
             print("\nTo visualize the schedule with detailed metrics, run:")
             print(f"  python visualizer.py --pdf output_gantt.pdf --detailed {args.output}")
@@ -206,18 +219,19 @@ def main():
 
 
 def simulate_schedule(scheduler, stochastic=True, old_execution_history = None):
-    env = simpy.Environment()
+    env = Environment()
     #closure to capture scheduler Object
     def task_finished_callback(env):
         Logger.debug("Task finished. Current Simulation time: %s" % env.now)
         Logger.debug("%s tasks remaining" % len(scheduler.tasks_to_do))
         #as long as the scheduler has work to do, spawn tasks until resources are depleted
-        while scheduler.has_next():
-                SimulationEntity(env, scheduler.get_next(), task_finished_callback, stochastic, old_execution_history)
+        spawn = SimulationEntity
+        for task in scheduler.drain_ready():
+            spawn(env, task, task_finished_callback, stochastic, old_execution_history)
 
     #spawn tasks until resources are depleted
-    while scheduler.has_next():
-            SimulationEntity(env, scheduler.get_next(), task_finished_callback, stochastic, old_execution_history)
+    for task in scheduler.drain_ready():
+        SimulationEntity(env, task, task_finished_callback, stochastic, old_execution_history)
     env.run()
     if scheduler.no_tasks_executed != 44:
         Logger.warning("either too much or to few tasks executed")
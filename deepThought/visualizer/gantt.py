@@ -2,10 +2,15 @@
 based on https://bitbucket.org/DBrent/phd/raw/1d1c5444d2ba2ee3918e0dfd5e886eaeeee49eec/visualisation/plot_gantt.py
 """
 
+from collections import Counter
 import matplotlib.pyplot as plt
 import matplotlib.font_manager as font_manager
 import pylab as pylab
 import matplotlib.patches as mpatches
+from matplotlib.collections import PolyCollection
+import numpy as np
+
+MIN_LABEL_WIDTH_PX = 40  # bars narrower than this get no text labels
 
 
 def create_gantt_chart(test_run_data):
@@ -55,34 +60,21 @@ def determine_top_resources(execution_history, n=7):
     Returns:
         list: Tuples of (resource, color) for the top n resources
     """
-    resource_frequency = {}
-    for task in execution_history:
-        for resource in task.usedResources:
-            if resource.max_share_count != 0:
-                if resource not in resource_frequency:
-                    resource_frequency[resource] = 0
-                resource_frequency[resource] += 1
+    resource_frequency = Counter(resource for task in execution_history for resource in task.usedResources
+                                 if resource.max_share_count != 0)
     
-    top_resources = []
-    for resource, frequency in list(resource_frequency.items()):
-        top_resources.append(((resource, frequency), None))  # Will assign color later
+    # Assign colors to resources using a colorful palette
+    colors = ['#ff1493', '#32cd32', '#1e90ff', '#ff8c00', '#9370db', '#20b2aa', '#ff6347', 
+              '#ffd700', '#3cb371', '#87cefa', '#f08080', '#7b68ee', '#00fa9a', '#ffa07a']
     
-    top_resources.sort(key=lambda tup: tup[0][1], reverse=True)
-    top_resources = top_resources[:n]
+    top_resources = [((resource, frequency), colors[i % len(colors)])
+                     for i, (resource, frequency) in enumerate(resource_frequency.most_common(n))]
     
     # Print resource information to console
     print("\nTOP RESOURCES USED IN SCHEDULE:")
     for i, ((resource, frequency), _) in enumerate(top_resources):
         print(f"  {i+1}. {resource.name}: Used {frequency} times")
     
-    # Assign colors to resources using a colorful palette
-    colors = ['#ff1493', '#32cd32', '#1e90ff', '#ff8c00', '#9370db', '#20b2aa', '#ff6347', 
-              '#ffd700', '#3cb371', '#87cefa', '#f08080', '#7b68ee', '#00fa9a', '#ffa07a']
-    
-    for i, ((resource, frequency), _) in enumerate(top_resources):
-        color = colors[i % len(colors)]
-        top_resources[i] = ((resource, frequency), color)
-    
     return top_resources
 
 def plot_gantt(simulation_result, top_resources, ax=None):
@@ -111,12 +103,14 @@ def plot_gantt(simulation_result, top_resources, ax=None):
     task_label_width = 30 if num_tasks < 30 else 15  # Adjust label length based on task count
     
     # Sort tasks by start time
-    sorted_tasks = sorted(simulation_result.execution_history, key=lambda x: x.startTime)
+    sorted_tasks = sorted(simulation_result.execution_history, key=lambda x: x.started)
     
-    # Plot each task
+    # Group the task bars by color so each color is drawn as a single collection
+    bars = {}
+    labels = []
     for i, task in enumerate(sorted_tasks):
-        start = task.startTime
-        duration = task.executionTime
+        start = task.started
+        duration = task.finished - task.started
         
         # Format the task label to include useful information
         task_name = task.name
@@ -129,19 +123,12 @@ def plot_gantt(simulation_result, top_resources, ax=None):
             if resource in resource_colors:
                 color = resource_colors[resource]
                 break
-        
-        # Plot the task bar
-        ax.barh(i, duration, left=start, height=0.8, color=color, alpha=0.8, 
-               edgecolor='black', linewidth=0.5)
-        
-        # Add task labels
-        ax.text(start + 0.1, i, task_name, va='center', fontsize=8, weight='bold')
-        
-        # Add duration info if there's enough space
-        if duration > 5:
-            ax.text(start + duration/2, i, f"{duration:.1f}", 
-                   ha='center', va='center', fontsize=7, color='black',
-                   bbox=dict(facecolor='white', alpha=0.7, boxstyle='round,pad=0.1'))
+        bars.setdefault(color, []).append((start, duration, i))
+        labels.append((start, duration, i, task_name))
+    
+    # Plot the task bars
+    for color, spans in bars.items():
+        add_task_bars(ax, spans, color)
     
     # Set y-ticks with task numbers
     ax.set_yticks(range(len(sorted_tasks)))
@@ -158,9 +145,66 @@ def plot_gantt(simulation_result, top_resources, ax=None):
     ax.set_xlim(0, max_time * 1.05)  # Add a small margin
     ax.set_ylim(-1, len(sorted_tasks))
     
+    # Only label bars which are wide enough on screen, narrower labels would overlap anyway.
+    # Widths are measured at the figure dpi before tight_layout, which only widens the axes, so the check errs towards
+    # dropping labels. Text scales with the dpi like the bars, so saving at another dpi doesn't change the result.
+    px_per_unit = ax.transData.transform((1, 0))[0] - ax.transData.transform((0, 0))[0]
+    for start, duration, i, task_name in labels:
+        width = duration * px_per_unit
+        if width < MIN_LABEL_WIDTH_PX:
+            continue
+        
+        # Add task labels
+        ax.text(start + 0.1, i, task_name, va='center', fontsize=8, weight='bold')
+        
+        # Add duration info if there's enough space
+        if width >= 2 * MIN_LABEL_WIDTH_PX and num_tasks <= 50:
+            ax.text(start + duration/2, i, f"{duration:.1f}", 
+                   ha='center', va='center', fontsize=7, color='black',
+                   bbox=dict(facecolor='white', alpha=0.7, boxstyle='round,pad=0.1'))
+    
     return ax
 
 
+def add_task_bars(ax, spans, color, height=0.8, **kwargs):
+    """
+    Draws horizontal task bars of a single color as one collection.
+    
+    Args:
+        ax: Matplotlib axes to plot on
+        spans: Iterable of (start, duration, row) tuples
+        color: Face color of the bars
+        height: Height of a bar in row units
+        kwargs: Further properties of the PolyCollection, e.g. rasterized or zorder
+    """
+    verts = [[(start, row - height/2), (start + duration, row - height/2),
+              (start + duration, row + height/2), (start, row + height/2)]
+             for start, duration, row in spans]
+    bars = PolyCollection(verts, facecolors=color, edgecolors='black', linewidths=0.5, alpha=0.8, **kwargs)
+    ax.add_collection(bars)
+    return bars
 
 
-
+def task_parallelism(starts, ends):
+    """
+    Computes how many tasks run concurrently in every whole time unit.
+    
+    Args:
+        starts: Array with the start time of every task
+        ends: Array with the end time of every task
+        
+    Returns:
+        tuple: the occupancy per time unit, the average and the maximum number of concurrent tasks while any task runs
+    """
+    # Difference array: +1 where a task starts, -1 after it ends, prefix sum yields the occupancy
+    first = np.asarray(starts).astype(np.int64)
+    last = np.asarray(ends).astype(np.int64)
+    delta = np.zeros(int(last.max()) + 2 if last.size else 1, np.int64)
+    np.add.at(delta, first, 1)
+    np.add.at(delta, last + 1, -1)
+    occupancy = np.cumsum(delta)
+    
+    active = occupancy[occupancy > 0]
+    avg_parallelism = active.mean() if active.size else 0
+    max_parallelism = active.max() if active.size else 0
+    return occupancy, avg_parallelism, max_parallelism
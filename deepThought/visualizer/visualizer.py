@@ -2,10 +2,11 @@ __author__ = 'jules'
 
 import sys
 import argparse
+import numpy as np
 import matplotlib.pyplot as plt
 from deepThought.util import Logger
 from deepThought.simulator.simulationResult import load_simulation_result
-from .gantt import determine_top_resources, create_gantt_chart, plot_gantt
+from .gantt import determine_top_resources, create_gantt_chart, plot_gantt, task_parallelism
 import deepThought.ORM.ORM as ORM
 
 
@@ -28,16 +29,17 @@ def main():
         return
     
     resource_list = determine_top_resources(data.execution_history, 7)
+    utilization = _resource_utilization(data)
     
     if args.pdf:
-        save_gantt_chart(data, args.pdf, args.dpi)
+        save_gantt_chart(data, args.pdf, args.dpi, utilization)
     
     # If detailed analysis is requested, print it to the console
     if args.detailed:
-        print_detailed_analysis(data, resource_list)
+        print_detailed_analysis(data, resource_list, utilization)
 
 
-def save_gantt_chart(test_run_data, output_file, dpi):
+def save_gantt_chart(test_run_data, output_file, dpi, utilization=None):
     """
     Creates a Gantt chart and saves it to a file.
     Enhanced with performance metrics and explanations.
@@ -46,7 +48,7 @@ def save_gantt_chart(test_run_data, output_file, dpi):
     fig, ax = create_gantt_chart(test_run_data)
     
     # Add performance metrics to the chart
-    add_performance_metrics(fig, ax, test_run_data)
+    add_performance_metrics(fig, ax, test_run_data, utilization)
     
     # Add explanation of colors
     add_color_legend_explanation(fig)
@@ -55,40 +57,24 @@ def save_gantt_chart(test_run_data, output_file, dpi):
     plt.savefig(output_file, dpi=dpi)
 
 
-def add_performance_metrics(fig, ax, result):
+def add_performance_metrics(fig, ax, result, utilization=None):
     """Add key performance metrics to the Gantt chart"""
     # Calculate metrics
     total_time = result.total_time
     
     # Calculate resource utilization
-    resources = {}
-    total_resource_time = 0
-    max_possible_resource_time = 0
-    
-    for task in result.execution_history:
-        task_duration = task.executionTime
-        for resource in task.usedResources:
-            if resource not in resources:
-                resources[resource] = 0
-            resources[resource] += task_duration
-            total_resource_time += task_duration
+    if utilization is None:
+        utilization = _resource_utilization(result)
+    resources, busy_time = utilization
+    total_resource_time = busy_time.sum()
     
     # Calculate max possible resource time (if all resources were used 100%)
     max_possible_resource_time = total_time * len(resources)
     resource_utilization = (total_resource_time / max_possible_resource_time * 100) if max_possible_resource_time > 0 else 0
     
     # Calculate parallelism (average number of tasks running concurrently)
-    timeline = {}
-    for task in result.execution_history:
-        start = int(task.startTime)
-        end = int(task.startTime + task.executionTime)
-        for t in range(start, end + 1):
-            if t not in timeline:
-                timeline[t] = 0
-            timeline[t] += 1
-    
-    avg_parallelism = sum(timeline.values()) / len(timeline) if timeline else 0
-    max_parallelism = max(timeline.values()) if timeline else 0
+    table = result.task_table
+    _, avg_parallelism, max_parallelism = task_parallelism(table['start'], table['start'] + table['dur'])
     
     # Create metrics text
     metrics_text = (
@@ -118,6 +104,19 @@ def add_performance_metrics(fig, ax, result):
             verticalalignment='center', horizontalalignment='left', bbox=props)
 
 
+def _resource_utilization(result):
+    """
+    Sums up the time each resource was in use, based on the column arrays of the result.
+
+    Returns:
+        tuple: list of the distinct resources and an array with the busy time of each of them
+    """
+    counts = np.diff(result.resource_indptr)
+    busy_time = np.bincount(result.resource_indices, weights=np.repeat(result.task_table['dur'], counts),
+                            minlength=len(result.resources))
+    return result.resources, busy_time
+
+
 def add_color_legend_explanation(fig):
     """Add explanation of what the colors represent"""
     explanation = (
@@ -133,7 +132,7 @@ def add_color_legend_explanation(fig):
              bbox=dict(boxstyle='round', facecolor='white', alpha=0.8))
 
 
-def print_detailed_analysis(data, resource_list):
+def print_detailed_analysis(data, resource_list, utilization=None):
     """Print a detailed text analysis of the schedule"""
     print("\n" + "="*50)
     print("DETAILED SCHEDULE ANALYSIS")
@@ -145,33 +144,32 @@ def print_detailed_analysis(data, resource_list):
     
     # Resource utilization
     print("\nRESOURCE UTILIZATION:")
-    resources = {}
-    for task in data.execution_history:
-        for resource in task.usedResources:
-            if resource.name not in resources:
-                resources[resource.name] = 0
-            resources[resource.name] += task.executionTime
+    if utilization is None:
+        utilization = _resource_utilization(data)
+    resources, busy_time = utilization
     
-    for name, time in sorted(resources.items(), key=lambda x: x[1], reverse=True):
-        utilization = (time / data.total_time) * 100
-        print(f"  {name}: {utilization:.1f}% ({time:.1f}/{data.total_time:.1f} time units)")
+    for i in np.argsort(-busy_time, kind='stable'):
+        name, time = resources[i].name, busy_time[i]
+        share = (time / data.total_time) * 100
+        print(f"  {name}: {share:.1f}% ({time:.1f}/{data.total_time:.1f} time units)")
     
     # Task execution timeline
     print("\nTASK EXECUTION TIMELINE:")
-    for task in sorted(data.execution_history, key=lambda t: t.startTime):
-        start = task.startTime
-        end = task.startTime + task.executionTime
-        resources_used = ", ".join([r.name for r in task.usedResources])
-        print(f"  {task.name}: Start={start:.1f}, End={end:.1f}, Duration={task.executionTime:.1f}, Resources={resources_used}")
+    table = data.task_table
+    names, starts, durations = table['name'], table['start'], table['dur']
+    ends = starts + durations
+    indptr, indices = data.resource_indptr, data.resource_indices
+    for i in np.argsort(starts, kind='stable'):
+        resources_used = ", ".join([resources[r].name for r in indices[indptr[i]:indptr[i + 1]]])
+        print(f"  {names[i]}: Start={starts[i]:.1f}, End={ends[i]:.1f}, Duration={durations[i]:.1f}, Resources={resources_used}")
     
     # Critical path analysis (simplified)
-    task_dict = {task.id: task for task in data.execution_history}
     end_time = data.total_time
-    critical_tasks = [task for task in data.execution_history if abs(task.startTime + task.executionTime - end_time) < 1.0]
+    critical = np.flatnonzero(np.abs(ends - end_time) < 1.0)
     
     print("\nPOTENTIAL CRITICAL PATH TASKS:")
-    for task in critical_tasks:
-        print(f"  {task.name} (ends at {task.startTime + task.executionTime:.1f})")
+    for i in critical.tolist():
+        print(f"  {names[i]} (ends at {ends[i]:.1f})")
     
     print("\nNOTE: This analysis shows how the genetic algorithm optimized task ordering and resource allocation to minimize project duration.")
 
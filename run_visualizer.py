@@ -2,47 +2,170 @@
 """
 Simple script to run the visualizer with fixed parameters
 """
-import matplotlib.pyplot as plt
-from deepThought.simulator.simulationResult import load_simulation_result
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.ticker import FuncFormatter
+from concurrent.futures import ThreadPoolExecutor
+from collections import Counter, defaultdict
+from deepThought.visualizer.gantt import add_task_bars, task_parallelism
 import matplotlib.patches as mpatches
+from dataclasses import dataclass
+from numba import njit
+import hashlib
+import os
+import pathlib
+import pickle
 import random
-import copy
+import tempfile
+import zipfile
 import numpy as np
 
+
+@dataclass(slots=True)
+class TaskView:
+    """Lightweight copy of the task fields the charts read or reschedule"""
+    name: str
+    started: float
+    finished: float
+    usedResources: list  # shared with the original task, only read
+
+
+@dataclass(slots=True, eq=False)
+class CachedResource:
+    """Stands in for a resource when the schedule is restored from the cache, compared by identity like resources"""
+    name: str
+
+
+@dataclass(slots=True)
+class CachedResult:
+    """The parts of a SimulationResult the charts read, restored from the cache"""
+    execution_history: list
+    total_time: float
+
+
+def load_schedule(path, cache_dir=".cache", max_cache_entries=8):
+    """
+    Loads the schedule of a simulation result. The task arrays are cached in cache_dir keyed by a hash of the
+    pickle, so repeated runs on the same result skip unpickling the whole object graph. Only the max_cache_entries
+    most recently used entries are kept.
+    
+    Returns:
+        The SimulationResult on a cache miss, otherwise a CachedResult with TaskViews of the tasks
+    """
+    raw = pathlib.Path(path).read_bytes()
+    key = hashlib.blake2b(raw, digest_size=8).hexdigest()
+    cache = pathlib.Path(cache_dir) / f"{key}.npz"
+    
+    if cache.exists():
+        try:
+            result = _read_cached_schedule(cache)
+            os.utime(cache)  # mark as recently used for pruning
+            return result
+        except (OSError, ValueError, KeyError, EOFError, zipfile.BadZipFile) as e:
+            print(f"Ignoring unreadable cache entry {cache}: {e}")
+    
+    data = pickle.loads(raw)
+    _write_cached_schedule(cache, data)
+    _prune_cache(cache.parent, max_cache_entries)
+    return data
+
+def _read_cached_schedule(cache):
+    with np.load(cache) as arrays:
+        resources = [CachedResource(name) for name in arrays["resource_names"].tolist()]
+        offsets = arrays["offsets"].tolist()
+        resource_ids = arrays["resource_ids"].tolist()
+        tasks = [TaskView(name, start, end, [resources[r] for r in resource_ids[offsets[i]:offsets[i + 1]]])
+                 for i, (name, start, end) in enumerate(zip(arrays["names"].tolist(), arrays["starts"].tolist(),
+                                                            arrays["ends"].tolist()))]
+        return CachedResult(tasks, float(arrays["total_time"]))
+
+def _write_cached_schedule(cache, data):
+    """Writes to a temporary file first and moves it into place, so an interrupted run never leaves a partial entry"""
+    tasks = data.execution_history
+    offsets, resource_ids, resource_index = index_resources(tasks)
+    cache.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(dir=cache.parent, suffix=".tmp", delete=False) as f:
+        try:
+            np.savez_compressed(f,
+                                starts=np.array([task.started for task in tasks], np.float64),
+                                ends=np.array([task.finished for task in tasks], np.float64),
+                                names=np.array([task.name for task in tasks], dtype=str),
+                                offsets=offsets,
+                                resource_ids=resource_ids,
+                                resource_names=np.array([resource.name for resource in resource_index], dtype=str),
+                                total_time=data.total_time)
+        except BaseException:
+            f.close()
+            os.unlink(f.name)
+            raise
+    os.replace(f.name, cache)
+
+def _prune_cache(cache_dir, max_entries):
+    """Removes all but the max_entries most recently used cache entries"""
+    entries = sorted(cache_dir.glob("*.npz"), key=lambda entry: entry.stat().st_mtime, reverse=True)
+    for entry in entries[max_entries:]:
+        entry.unlink(missing_ok=True)
+
+def snapshot_tasks(data):
+    """Copies the schedule of a simulation result so it can be modified without touching the original tasks"""
+    return [TaskView(t.name, t.started, t.finished, t.usedResources) for t in data.execution_history]
+
 def main():
     # Load the simulation result
     try:
-        data = load_simulation_result("output.pickle")
+        data = load_schedule("output.pickle")
         print(f"Loaded simulation result with {len(data.execution_history)} tasks")
         print(f"Total duration: {data.total_time}")
         
+        # Metrics and colors of the optimized schedule are shared by all charts
+        opt_metrics = calculate_schedule_metrics(data.execution_history, data.total_time)
+        resource_colors = assign_colors_to_resources(sorted(data.execution_history, key=lambda x: x.started))
+        
         # Create optimized Gantt chart
-        create_optimized_chart(data)
+        charts = [create_optimized_chart(data, opt_metrics, resource_colors)]
         
-        # Create non-optimized chart for comparison
-        create_non_optimized_chart(data)
+        # The non-optimized charts are only for demonstration, set SKIP_NONOPT=1 to leave them out
+        if os.environ.get('SKIP_NONOPT', '').strip().lower() not in {"1", "true", "yes"}:
+            # Create non-optimized chart for comparison: every task waits 5 time units and takes 20% longer
+            non_opt = simulate_bad_schedule(snapshot_tasks(data), delay=5, inflate=1.2)
+            charts.append(create_non_optimized_chart(non_opt, resource_colors))
+            
+            # Create side-by-side comparison against a worse variant: 10 time units delay, 40% longer
+            comparison = simulate_bad_schedule(snapshot_tasks(data), delay=10, inflate=1.4)
+            charts.append(create_comparison_view(comparison, opt_metrics))
         
-        # Create side-by-side comparison
-        create_comparison_view(data)
+        # Write the charts concurrently, each figure has its own canvas and shares no state with the others
+        with ThreadPoolExecutor(max_workers=len(charts)) as executor:
+            for description, filename in executor.map(save_chart, charts):
+                print(f"Saved {description} to {filename}")
         
     except Exception as e:
         import traceback
         traceback.print_exc()
         print(f"Error: {e}")
 
-def create_optimized_chart(data):
+def new_figure(figsize):
+    """Creates a figure with its own Agg canvas, independent of the global pyplot state"""
+    fig = Figure(figsize=figsize)
+    FigureCanvasAgg(fig)
+    return fig, fig.add_subplot(111)
+
+def save_chart(chart):
+    """Saves a (figure, filename, description) tuple returned by the chart builders"""
+    fig, filename, description = chart
+    fig.savefig(filename, dpi=150, metadata={'Creator': 'gantt'})
+    return description, filename
+
+def create_optimized_chart(data, metrics, resource_colors):
     """Create the optimized chart from genetic algorithm results"""
     print("\nCreating optimized Gantt chart...")
-    fig, ax = plt.subplots(figsize=(12, 8))
+    fig, ax = new_figure(figsize=(12, 8))
     
     # Sort tasks by start time
     sorted_tasks = sorted(data.execution_history, key=lambda x: x.started)
     
-    # Get top resources and assign colors
-    resource_colors = assign_colors_to_resources(sorted_tasks)
-    
     # Plot tasks
-    plot_tasks(ax, sorted_tasks, resource_colors)
+    plot_tasks(ax, sorted_tasks, color_tasks(sorted_tasks, resource_colors))
     
     # Add title and labels
     ax.set_title(f"OPTIMIZED Schedule - Total Duration: {data.total_time:.1f} time units", fontsize=14)
@@ -53,7 +176,7 @@ def create_optimized_chart(data):
     ax.grid(True, alpha=0.3)
     
     # Add performance metrics to the chart
-    add_performance_metrics(fig, ax, data, is_optimized=True)
+    add_performance_metrics(fig, ax, data.execution_history, data.total_time, is_optimized=True, metrics=metrics)
     
     # Add resource legend
     add_resource_legend(fig, ax, resource_colors)
@@ -61,79 +184,41 @@ def create_optimized_chart(data):
     # Add explanation of colors
     add_color_legend_explanation(fig)
     
-    # Save the chart
-    plt.tight_layout()
-    plt.savefig("gantt_optimized.pdf", dpi=300)
-    print("Saved optimized Gantt chart to gantt_optimized.pdf")
+    fig.tight_layout()
+    return fig, chart_filename("gantt_optimized", len(sorted_tasks)), "optimized Gantt chart"
 
-def create_non_optimized_chart(data):
-    """Create a non-optimized chart by shuffling the task order"""
-    print("\nCreating non-optimized Gantt chart for comparison...")
-    
-    # Create a copy of the data to avoid modifying the original
-    non_opt_data = copy.deepcopy(data)
-    tasks = non_opt_data.execution_history
-    
-    # Store original durations
-    original_durations = {}
-    for task in tasks:
-        original_durations[task.name] = task.finished - task.started
-    
-    # Shuffle the task order (simple non-optimized approach)
-    random.seed(42)  # Set seed for reproducibility
-    
-    # Sort tasks randomly, but respecting constraints
+def simulate_bad_schedule(tasks, delay, inflate, seed=42):
+    """
+    Simulates a simple "bad" scheduler (less efficient than the genetic algorithm) on a snapshot of the tasks.
+    It doesn't try to optimize parallel execution or minimize total time: the tasks run in a shuffled order,
+    every task waits `delay` time units after the previous one and takes `inflate` times as long.
+    
+    Returns:
+        tuple: the rescheduled tasks and the total duration of the schedule
+    """
+    # Shuffle the task order with a private generator, the seed keeps the charts reproducible
     shuffled_tasks = tasks.copy()
-    random.shuffle(shuffled_tasks)
-    
-    # Apply a simple "bad" scheduler (less efficient than genetic algorithm)
-    # This one doesn't try to optimize parallel execution or minimize total time
-    resource_release_times = {}  # When each resource becomes available
-    
-    # Reset task times
-    for task in shuffled_tasks:
-        task.started = 0
-        task.finished = 0
+    random.Random(seed).shuffle(shuffled_tasks)
     
-    # Schedule tasks one by one, but in a suboptimal way
-    start_time = 0
-    for task in shuffled_tasks:
-        # Always wait a bit after the previous task (simulating poor coordination)
-        possible_start_time = start_time + 5  # Add artificial delay
-        
-        # Check when all required resources are available
-        for resource in task.usedResources:
-            if resource in resource_release_times:
-                if resource_release_times[resource] > possible_start_time:
-                    possible_start_time = resource_release_times[resource]
-        
-        # Set task times using original durations
-        task.started = possible_start_time
-        duration = original_durations[task.name] * 1.2  # Make tasks take 20% longer (inefficiency)
-        task.finished = possible_start_time + duration
-        
-        # Update resource release times
-        for resource in task.usedResources:
-            resource_release_times[resource] = task.finished
-        
-        # Move the start time forward for next task (poor parallelization)
-        start_time = possible_start_time
+    reschedule_inefficiently(shuffled_tasks, delay=delay, inflate=inflate)
     
-    # Calculate total duration
     total_duration = max(task.finished for task in shuffled_tasks) if shuffled_tasks else 0
-    non_opt_data.total_time = total_duration
+    return shuffled_tasks, total_duration
+
+def create_non_optimized_chart(non_opt, resource_colors):
+    """Create a non-optimized chart from a schedule computed by simulate_bad_schedule"""
+    print("\nCreating non-optimized Gantt chart for comparison...")
+    
+    shuffled_tasks, total_duration = non_opt
     
     # Create the chart
-    fig, ax = plt.subplots(figsize=(12, 8))
+    fig, ax = new_figure(figsize=(12, 8))
     
     # Sort tasks by start time
     sorted_tasks = sorted(shuffled_tasks, key=lambda x: x.started)
     
-    # Get top resources and assign colors (use same color scheme as optimized)
-    resource_colors = assign_colors_to_resources(sorted_tasks)
-    
     # Plot tasks
-    plot_tasks(ax, sorted_tasks, resource_colors)
+    plot_tasks(ax, sorted_tasks, color_tasks(sorted_tasks, resource_colors))
     
     # Add title and labels
     ax.set_title(f"NON-OPTIMIZED Schedule - Total Duration: {total_duration:.1f} time units", fontsize=14)
@@ -144,70 +229,31 @@ def create_non_optimized_chart(data):
     ax.grid(True, alpha=0.3)
     
     # Add performance metrics to the chart
-    add_performance_metrics(fig, ax, non_opt_data, is_optimized=False)
+    add_performance_metrics(fig, ax, shuffled_tasks, total_duration, is_optimized=False)
     
     # Add resource legend
     add_resource_legend(fig, ax, resource_colors)
     
-    # Save the chart
-    plt.tight_layout()
-    plt.savefig("gantt_non_optimized.pdf", dpi=300)
-    print("Saved non-optimized Gantt chart to gantt_non_optimized.pdf")
-    
-    return non_opt_data
+    fig.tight_layout()
+    return fig, chart_filename("gantt_non_optimized", len(sorted_tasks)), "non-optimized Gantt chart"
 
-def create_comparison_view(data):
+def create_comparison_view(non_opt, opt_metrics):
     """Create a side-by-side comparison of metrics between optimized and non-optimized schedules"""
     print("\nCreating comparison analysis...")
     
-    # Create a copy for non-optimized data
-    non_opt_data = copy.deepcopy(data)
-    tasks = non_opt_data.execution_history
-    
-    # Store original durations
-    original_durations = {}
-    for task in tasks:
-        original_durations[task.name] = task.finished - task.started
+    shuffled_tasks, non_opt_total_time = non_opt
     
-    # Shuffle and reschedule with inefficiencies
-    random.seed(42)
-    shuffled_tasks = tasks.copy()
-    random.shuffle(shuffled_tasks)
-    
-    # Simple inefficient scheduling
-    resource_release_times = {}
-    start_time = 0
-    
-    for task in shuffled_tasks:
-        # Poor scheduling with delays
-        possible_start_time = start_time + 10  # Larger artificial delay
-        
-        # Check resource availability (with poor coordination)
-        for resource in task.usedResources:
-            if resource in resource_release_times:
-                possible_start_time = max(possible_start_time, resource_release_times[resource])
-        
-        # Set task times with inefficiencies
-        duration = original_durations[task.name] * 1.4  # 40% longer than optimal
-        task.started = possible_start_time
-        task.finished = possible_start_time + duration
-        
-        # Update resource times
-        for resource in task.usedResources:
-            resource_release_times[resource] = task.finished
-        
-        # Move start time forward (poor parallelization)
-        start_time = possible_start_time
-    
-    # Calculate total duration
-    non_opt_data.total_time = max(task.finished for task in shuffled_tasks) if shuffled_tasks else 0
-    
-    # Calculate metrics for both schedules
-    opt_metrics = calculate_schedule_metrics(data)
-    non_opt_metrics = calculate_schedule_metrics(non_opt_data)
+    # Calculate metrics for the non-optimized schedule
+    non_opt_metrics = calculate_schedule_metrics(shuffled_tasks, non_opt_total_time)
     
     # Create comparison chart
-    fig, ax = plt.subplots(figsize=(10, 6))
+    # The explanation gets its own column, so it fits without rescaling the figure afterwards
+    fig = Figure(figsize=(14, 6), layout='constrained')
+    FigureCanvasAgg(fig)
+    gs = fig.add_gridspec(1, 2, width_ratios=[3, 1])
+    ax = fig.add_subplot(gs[0, 0])
+    text_ax = fig.add_subplot(gs[0, 1])
+    text_ax.axis('off')
     
     # Metrics to compare
     metrics = [
@@ -284,12 +330,8 @@ def create_comparison_view(data):
     
     # Add explanation text box
     props = dict(boxstyle='round', facecolor='white', alpha=0.9)
-    ax.text(1.05, 0.5, explanation, transform=ax.transAxes, fontsize=9,
-            verticalalignment='center', bbox=props)
-    
-    plt.tight_layout()
-    plt.savefig("comparison_chart.pdf", dpi=300)
-    print("Saved comparison chart to comparison_chart.pdf")
+    text_ax.text(0, 0.5, explanation, transform=text_ax.transAxes, fontsize=9,
+                 verticalalignment='center', bbox=props)
     
     # Print comparison metrics
     print("\n" + "="*50)
@@ -302,142 +344,160 @@ def create_comparison_view(data):
     print(f"Max Concurrent Tasks: {opt_metrics['max_parallelism']} vs {non_opt_metrics['max_parallelism']} ({improvements[3]:.1f}% improvement)")
     
     print("\nThis comparison demonstrates how the genetic algorithm creates a more efficient schedule compared to a non-optimized approach.")
+    
+    return fig, "comparison_chart.pdf", "comparison chart"
 
-def plot_tasks(ax, tasks, resource_colors):
-    """Helper function to plot tasks with consistent formatting"""
+def index_resources(tasks):
+    """
+    Numbers the resources used by the tasks, so later passes index arrays instead of hashing resource objects.
+    
+    Returns:
+        tuple: offsets and resource_ids, the resource numbers of task i are resource_ids[offsets[i]:offsets[i + 1]],
+               and the dict mapping each resource to its number
+    """
+    resource_index = {}
+    resource_ids = []
+    offsets = np.zeros(len(tasks) + 1, np.int64)
     for i, task in enumerate(tasks):
-        start = task.started
-        duration = task.finished - task.started
+        resource_ids.extend(resource_index.setdefault(resource, len(resource_index)) for resource in task.usedResources)
+        offsets[i + 1] = len(resource_ids)
+    return offsets, np.array(resource_ids, np.int64), resource_index
+
+def reschedule_inefficiently(tasks, delay, inflate):
+    """
+    Reschedules the tasks in list order with poor coordination: each task starts at least delay time units after
+    the previous one, waits for all its resources and takes inflate times its original duration.
+    Updates started/finished of the tasks in place.
+    """
+    offsets, resource_ids, resource_index = index_resources(tasks)
+    durations = np.fromiter((task.finished - task.started for task in tasks), np.float64, len(tasks))
+    
+    starts, ends = _schedule_inefficiently(offsets, resource_ids, durations,
+                                           len(resource_index), float(delay), float(inflate))
+    for task, start, end in zip(tasks, starts.tolist(), ends.tolist()):
+        task.started = start
+        task.finished = end
+
+@njit(cache=True)
+def _schedule_inefficiently(offsets, resource_ids, durations, n_resources, delay, inflate):
+    starts = np.empty(durations.size)
+    ends = np.empty(durations.size)
+    release_times = np.zeros(n_resources)  # When each resource becomes available
+    start_time = 0.0
+    for i in range(durations.size):
+        # Always wait a bit after the previous task (simulating poor coordination)
+        possible_start_time = start_time + delay
         
-        # Determine color based on resources
-        color = 'gray'  # Default color
-        for resource in task.usedResources:
-            if resource in resource_colors:
-                color = resource_colors[resource]
-                break
+        # Check when all required resources are available
+        for k in range(offsets[i], offsets[i + 1]):
+            possible_start_time = max(possible_start_time, release_times[resource_ids[k]])
+        
+        starts[i] = possible_start_time
+        ends[i] = possible_start_time + durations[i] * inflate
         
-        # Plot the task bar
-        ax.barh(i, duration, left=start, height=0.8, color=color, alpha=0.8,
-               edgecolor='black', linewidth=0.5)
+        # Update resource release times
+        for k in range(offsets[i], offsets[i + 1]):
+            release_times[resource_ids[k]] = ends[i]
+        
+        # Move the start time forward for next task (poor parallelization)
+        start_time = possible_start_time
+    return starts, ends
+
+def chart_filename(name, num_tasks):
+    """Gantt charts with many tasks are written as PNG, as PDF they get huge and slow to write"""
+    return f"{name}.png" if num_tasks > 500 else f"{name}.pdf"
+
+def color_tasks(tasks, resource_colors):
+    """Returns the color of each task: the color of its first top resource, gray if it uses none of them"""
+    return [next((resource_colors[r] for r in task.usedResources if r in resource_colors), 'gray')
+            for task in tasks]
+
+def plot_tasks(ax, tasks, task_colors):
+    """Helper function to plot tasks with consistent formatting"""
+    # Group the task bars by color so each color is drawn as a single collection
+    bars = {}
+    for i, (task, color) in enumerate(zip(tasks, task_colors)):
+        start = task.started
+        duration = task.finished - task.started
+        bars.setdefault(color, []).append((start, duration, i))
         
         # Add task labels
-        ax.text(start + 0.1, i, f"{task.name}", va='center', fontsize=8, weight='bold')
+        ax.text(start + 0.1, i, f"{task.name}", va='center', fontsize=8, weight='bold', clip_on=True)
         
         # Add duration info if there's enough space
-        if duration > 10:
+        if duration > 10 and len(tasks) <= 200:
             ax.text(start + duration/2, i, f"{duration:.1f}", 
-                   ha='center', va='center', fontsize=7, color='black',
+                   ha='center', va='center', fontsize=7, color='black', clip_on=True,
                    bbox=dict(facecolor='white', alpha=0.7, boxstyle='round,pad=0.1'))
     
-    # Set y-ticks with task numbers
-    ax.set_yticks(range(len(tasks)))
-    ax.set_yticklabels([f"Task {i+1}" for i in range(len(tasks))])
+    # Plot the task bars. They are rasterized in vector output while the labels stay vector text
+    for color, spans in bars.items():
+        add_task_bars(ax, spans, color, rasterized=True, zorder=0)
+    ax.set_rasterization_zorder(1)
+    ax.autoscale_view()
+    
+    # Set y-ticks with task numbers, with many tasks only about 25 rows are labelled
+    step = max(1, len(tasks) // 25) if len(tasks) > 50 else 1
+    ax.set_yticks(np.arange(0, len(tasks), step))
+    ax.yaxis.set_major_formatter(FuncFormatter(lambda value, _: f"Task {int(value) + 1}"))
 
-def calculate_schedule_metrics(result):
+def calculate_schedule_metrics(tasks, total_time):
     """Calculate schedule metrics for comparison"""
-    total_time = result.total_time
-    tasks_count = len(result.execution_history)
+    tasks_count = len(tasks)
+    starts = np.fromiter((task.started for task in tasks), np.float64, tasks_count)
+    ends = np.fromiter((task.finished for task in tasks), np.float64, tasks_count)
+    durations = ends - starts
     
     # Calculate resource utilization
-    resources = {}
-    total_resource_time = 0
-    max_possible_resource_time = 0
-    
-    for task in result.execution_history:
-        task_duration = task.finished - task.started
-        for resource in task.usedResources:
-            if resource not in resources:
-                resources[resource] = 0
-            resources[resource] += task_duration
-            total_resource_time += task_duration
+    offsets, _, resource_index = index_resources(tasks)
+    total_resource_time = (durations * np.diff(offsets)).sum()
     
     # Calculate max possible resource time (if all resources were used 100%)
-    max_possible_resource_time = total_time * len(resources)
+    max_possible_resource_time = total_time * len(resource_index)
     resource_utilization = (total_resource_time / max_possible_resource_time * 100) if max_possible_resource_time > 0 else 0
     
     # Calculate parallelism (average number of tasks running concurrently)
-    timeline = {}
-    for task in result.execution_history:
-        start = int(task.started)
-        end = int(task.finished)
-        for t in range(start, end + 1):
-            if t not in timeline:
-                timeline[t] = 0
-            timeline[t] += 1
-    
-    avg_parallelism = sum(timeline.values()) / len(timeline) if timeline else 0
-    max_parallelism = max(timeline.values()) if timeline else 0
+    occupancy, avg_parallelism, max_parallelism = task_parallelism(starts, ends)
     
     return {
         "total_time": total_time,
         "tasks_count": tasks_count,
         "resource_utilization": resource_utilization,
         "avg_parallelism": avg_parallelism,
-        "max_parallelism": max_parallelism
+        "max_parallelism": max_parallelism,
+        # Per-task and per-time-unit arrays, so later passes don't rebuild the timeline
+        "starts": starts,
+        "ends": ends,
+        "occupancy": occupancy
     }
 
 def assign_colors_to_resources(tasks):
     """Assigns colors to the most frequently used resources"""
-    # Count resource frequency
-    resource_frequency = {}
-    for task in tasks:
-        for resource in task.usedResources:
-            if resource not in resource_frequency:
-                resource_frequency[resource] = 0
-            resource_frequency[resource] += 1
-    
-    # Sort resources by frequency
-    sorted_resources = sorted(resource_frequency.items(), key=lambda x: x[1], reverse=True)
+    # Count resource frequency and keep the top 7 resources
+    resource_frequency = Counter(resource for task in tasks for resource in task.usedResources)
+    top_resources = resource_frequency.most_common(7)
     
     # Assign colors to top resources
     colors = ['#ff1493', '#32cd32', '#1e90ff', '#ff8c00', '#9370db', '#20b2aa', '#ff6347']
-    resource_colors = {}
-    
-    for i, (resource, frequency) in enumerate(sorted_resources[:7]):  # Top 7 resources
-        resource_colors[resource] = colors[i % len(colors)]
+    resource_colors = {resource: colors[i % len(colors)] for i, (resource, _) in enumerate(top_resources)}
     
     # Print resource information
     print("\nTOP RESOURCES USED IN SCHEDULE:")
-    for i, (resource, frequency) in enumerate(sorted_resources[:7]):
+    for i, (resource, frequency) in enumerate(top_resources):
         print(f"  {i+1}. {resource.name}: Used {frequency} times")
     
     return resource_colors
 
-def add_performance_metrics(fig, ax, result, is_optimized=True):
-    """Add key performance metrics to the Gantt chart"""
-    # Calculate metrics
-    total_time = result.total_time
-    tasks_count = len(result.execution_history)
+def add_performance_metrics(fig, ax, tasks, total_time, is_optimized=True, metrics=None):
+    """Add performance metrics to the Gantt chart, pass metrics if the caller already computed them"""
+    if metrics is None:
+        metrics = calculate_schedule_metrics(tasks, total_time)
     
-    # Calculate resource utilization
-    resources = {}
-    total_resource_time = 0
-    max_possible_resource_time = 0
-    
-    for task in result.execution_history:
-        task_duration = task.finished - task.started
-        for resource in task.usedResources:
-            if resource not in resources:
-                resources[resource] = 0
-            resources[resource] += task_duration
-            total_resource_time += task_duration
-    
-    # Calculate max possible resource time (if all resources were used 100%)
-    max_possible_resource_time = total_time * len(resources)
-    resource_utilization = (total_resource_time / max_possible_resource_time * 100) if max_possible_resource_time > 0 else 0
-    
-    # Calculate parallelism (average number of tasks running concurrently)
-    timeline = {}
-    for task in result.execution_history:
-        start = int(task.started)
-        end = int(task.finished)
-        for t in range(start, end + 1):
-            if t not in timeline:
-                timeline[t] = 0
-            timeline[t] += 1
-    
-    avg_parallelism = sum(timeline.values()) / len(timeline) if timeline else 0
-    max_parallelism = max(timeline.values()) if timeline else 0
+    total_time = metrics["total_time"]
+    tasks_count = metrics["tasks_count"]
+    resource_utilization = metrics["resource_utilization"]
+    avg_parallelism = metrics["avg_parallelism"]
+    max_parallelism = metrics["max_parallelism"]
     
     # Create metrics text
     metrics_text = (
@@ -477,12 +537,8 @@ def add_performance_metrics(fig, ax, result, is_optimized=True):
 
 def add_resource_legend(fig, ax, resource_colors):
     """Add a legend for resources"""
-    legend_patches = []
-    legend_labels = []
-    
-    for resource, color in resource_colors.items():
-        legend_patches.append(mpatches.Patch(color=color))
-        legend_labels.append(f"{resource.name}")
+    legend_patches = [mpatches.Patch(color=color) for color in resource_colors.values()]
+    legend_labels = [resource.name for resource in resource_colors]
     
     # Add legend to chart
     ax.legend(legend_patches, legend_labels, 
@@ -504,8 +560,8 @@ def add_color_legend_explanation(fig):
     fig.text(0.5, 0.01, explanation, ha='center', va='bottom', fontsize=8, 
              bbox=dict(boxstyle='round', facecolor='white', alpha=0.8))
 
-def print_detailed_analysis(data, resource_colors):
-    """Print a detailed text analysis of the schedule"""
+def print_detailed_analysis(data, resource_colors, metrics=None):
+    """Print a detailed text analysis of the schedule, pass metrics if calculate_schedule_metrics already ran"""
     print("\n" + "="*50)
     print("DETAILED SCHEDULE ANALYSIS")
     print("="*50)
@@ -516,12 +572,10 @@ def print_detailed_analysis(data, resource_colors):
     
     # Resource utilization
     print("\nRESOURCE UTILIZATION:")
-    resources = {}
+    resources = defaultdict(float)
     for task in data.execution_history:
         task_duration = task.finished - task.started
         for resource in task.usedResources:
-            if resource.name not in resources:
-                resources[resource.name] = 0
             resources[resource.name] += task_duration
     
     for name, time in sorted(resources.items(), key=lambda x: x[1], reverse=True):
@@ -539,11 +593,15 @@ def print_detailed_analysis(data, resource_colors):
     
     # Critical path analysis (simplified)
     end_time = data.total_time
-    critical_tasks = [task for task in data.execution_history if abs(task.finished - end_time) < 1.0]
+    if metrics is not None:
+        ends = metrics["ends"]
+    else:
+        ends = np.fromiter((task.finished for task in data.execution_history), np.float64, len(data.execution_history))
+    critical_indices = np.flatnonzero(np.abs(ends - end_time) < 1.0)
     
     print("\nPOTENTIAL CRITICAL PATH TASKS:")
-    for task in critical_tasks:
-        print(f"  {task.name} (ends at {task.finished:.1f})")
+    for i in critical_indices.tolist():
+        print(f"  {data.execution_history[i].name} (ends at {ends[i]:.1f})")
     
     print("\nNOTE: This analysis shows how the genetic algorithm optimized task ordering and resource allocation to minimize project duration.")
 
@@ -0,0 +1,79 @@
+import pytest
+
+import deepThought.ORM.ORM as ORM
+from deepThought.scheduler.RBPolicy import RBPolicy
+from deepThought.simulator.environment import Environment
+from deepThought.simulator.simulator import simulate_schedule
+
+
+def test_events_run_in_time_order():
+    env = Environment()
+    fired = []
+    env.schedule(5, lambda: fired.append(("late", env.now)))
+    env.schedule(1, lambda: fired.append(("early", env.now)))
+    env.run()
+    assert fired == [("early", 1), ("late", 5)]
+
+
+def test_events_at_the_same_time_run_first_in_first_out():
+    env = Environment()
+    fired = []
+    for name in "abcde":
+        env.schedule(3, lambda name=name: fired.append(name))
+    env.run()
+    assert fired == list("abcde")
+    assert env.now == 3
+
+
+def test_events_scheduled_while_running_are_relative_to_now():
+    env = Environment()
+    fired = []
+
+    def first():
+        fired.append(env.now)
+        env.schedule(0, lambda: fired.append(env.now))
+        env.schedule(2, lambda: fired.append(env.now))
+
+    env.schedule(4, first)
+    env.schedule(4, lambda: fired.append("same time, scheduled earlier"))
+    env.run()
+    assert fired == [4, "same time, scheduled earlier", 4, 6]
+
+
+def test_negative_delay_is_rejected():
+    env = Environment()
+    with pytest.raises(ValueError):
+        env.schedule(-1, lambda: None)
+
+
+def _small_job():
+    """
+    Two exclusive resources A and B and four tasks with fixed durations:
+    0 uses A for 10, 1 uses A for 20, 2 uses B for 5 and 3 uses A and B for 7.
+    """
+    job = ORM.Job()
+    for resource_id in ("A", "B"):
+        resource = ORM.Resource()
+        resource.id = resource_id
+        resource.name = "Resource %s" % resource_id
+        resource.set_max_share_count(1)
+        job.resources[resource_id] = resource
+
+    for task_id, mean, resource_ids in ((0, 10, "A"), (1, 20, "A"), (2, 5, "B"), (3, 7, "AB")):
+        task = ORM.Task()
+        task.id = task_id
+        task.name = "Task %s" % task_id
+        task.mean = mean
+        task.distribution_type = ORM.DistributionType.FIXED
+        task.required_resources = [job.resources[resource_id] for resource_id in resource_ids]
+        job.tasks[task_id] = task
+    return job
+
+
+def test_simulate_schedule_reproduces_known_makespan():
+    # 0 and 2 start at once, 1 waits for A until 10, 3 waits for A until 30 and ends at 37
+    result = simulate_schedule(RBPolicy(_small_job(), [0, 1, 2, 3]), stochastic=False)
+
+    assert result.total_time == 37
+    spans = {task.id: (task.started, task.finished) for task in result.execution_history}
+    assert spans == {0: (0, 10), 1: (10, 30), 2: (0, 5), 3: (30, 37)}
@@ -0,0 +1,52 @@
+import functools
+
+from deap import base
+
+import deepThought.multiprocessing.fitnessPool as fitnessPool
+
+
+class _Job(object):
+    def __init__(self, weight):
+        self.weight = weight
+
+
+def _weighted_sum(job, individual):
+    return job.weight * sum(individual), len(individual)
+
+
+def test_evaluate_passes_the_worker_job():
+    fitnessPool._init_worker(_Job(3))
+    try:
+        assert fitnessPool.evaluate(_weighted_sum, [1, 2, 3]) == (18, 3)
+    finally:
+        fitnessPool._job = None
+
+
+def test_pool_matches_serial_evaluation():
+    job = _Job(2)
+    individuals = [[1, 2], [3], [4, 5, 6], []]
+    pool = fitnessPool.create_pool(job, 2)
+    try:
+        # this is how the genetic algorithms register evaluate and map with a pool
+        fitnesses = list(pool.map(functools.partial(fitnessPool.evaluate, _weighted_sum), individuals))
+    finally:
+        pool.shutdown()
+    assert fitnesses == [_weighted_sum(job, individual) for individual in individuals]
+
+
+def test_registered_toolbox_evaluates_serially_and_in_pool():
+    job = _Job(2)
+    individuals = [(1, 2), [3], [4, 5, 6]]
+    expected = [_weighted_sum(job, list(individual)) for individual in individuals]
+
+    serial = base.Toolbox()
+    fitnessPool.register_evaluation(serial, _weighted_sum, job)
+    assert list(serial.evaluate_all(individuals)) == expected
+
+    pool = fitnessPool.create_pool(job, 2)
+    try:
+        pooled = base.Toolbox()
+        fitnessPool.register_evaluation(pooled, _weighted_sum, job, pool)
+        assert list(pooled.evaluate_all(individuals)) == expected
+    finally:
+        pool.shutdown()
@@ -0,0 +1,25 @@
+import numpy as np
+
+from run_visualizer import TaskView, _schedule_inefficiently, reschedule_inefficiently
+
+
+def test_schedule_inefficiently_waits_for_delay_and_resources():
+    # task 0 uses resource 0, task 1 resource 1 and task 2 both of them
+    offsets = np.array([0, 1, 2, 4], np.int64)
+    resource_ids = np.array([0, 1, 0, 1], np.int64)
+    durations = np.array([10.0, 4.0, 2.0])
+
+    starts, ends = _schedule_inefficiently(offsets, resource_ids, durations, 2, 5.0, 1.5)
+
+    # each task starts at least 5 after the previous one, task 2 waits until resource 0 is released at 20
+    np.testing.assert_allclose(starts, [5.0, 10.0, 20.0])
+    np.testing.assert_allclose(ends, [20.0, 16.0, 23.0])
+
+
+def test_reschedule_inefficiently_updates_tasks_in_place():
+    a, b = object(), object()
+    tasks = [TaskView("t0", 0.0, 10.0, [a]), TaskView("t1", 0.0, 4.0, [b]), TaskView("t2", 3.0, 5.0, [a, b])]
+
+    reschedule_inefficiently(tasks, delay=5, inflate=1.5)
+
+    assert [(task.started, task.finished) for task in tasks] == [(5.0, 20.0), (10.0, 16.0), (20.0, 23.0)]
@@ -0,0 +1,31 @@
+from deepThought.simulator.simulationResult import SimulationResult
+
+
+class _Resource(object):
+    def __init__(self, name):
+        self.name = name
+
+
+class _Task(object):
+    def __init__(self, id, name, started, finished, used_resources):
+        self.id = id
+        self.name = name
+        self.started = started
+        self.finished = finished
+        self.usedResources = used_resources
+
+
+def test_arrays_are_built_on_demand_and_follow_the_history():
+    a, b = _Resource("A"), _Resource("B")
+    result = SimulationResult()
+    result.set_execution_history([_Task(0, "first", 0.0, 4.0, [a]), _Task(1, "second", 4.0, 10.0, [b, a])])
+
+    assert result.task_table['dur'].tolist() == [4.0, 6.0]
+    assert result.task_table['name'].tolist() == ["first", "second"]
+    assert result.resources == [a, b]
+    assert result.resource_indptr.tolist() == [0, 1, 3]
+    assert result.resource_indices.tolist() == [0, 1, 0]
+
+    result.set_execution_history([_Task(2, "third", 1.0, 2.0, [b])])
+    assert result.task_table['name'].tolist() == ["third"]
+    assert result.resources == [b]